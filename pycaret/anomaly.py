@@ -1261,6 +1261,8 @@ def create_model(model = None,
     
     import logging
     
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -1464,7 +1466,7 @@ def create_model(model = None,
     
     else:    
         def get_model_name(e):
-            return str(e).split("(")[0]
+            return type(e).__name__
 
         model == model
         full_name = get_model_name(model)
@@ -1514,12 +1516,7 @@ def create_model(model = None,
             RunID = mlflow.active_run().info.run_id
 
             # Log model parameters
-            params = model.get_params()
-
-            for i in list(params):
-                v = params.get(i)
-                if len(str(v)) > 250:
-                    params.pop(i)
+            params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
 
             mlflow.log_params(params)
             
@@ -1551,7 +1548,6 @@ def create_model(model = None,
                 logger.info("SubProcess plot_model() end ==================================")
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -1572,8 +1568,8 @@ def create_model(model = None,
             input_example = data_.iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
 
@@ -1640,6 +1636,8 @@ def assign_model(model,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -1863,6 +1861,8 @@ def plot_model(model,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -2156,6 +2156,8 @@ def tune_model(model=None,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -2393,10 +2395,7 @@ def tune_model(model=None,
         
         logger.info("Custom Grid used")
         param_grid = custom_grid
-        param_grid_with_zero = [0]
-
-        for i in param_grid:
-            param_grid_with_zero.append(i)
+        param_grid_with_zero = [0, *param_grid]
 
     else:
         
@@ -3332,12 +3331,7 @@ def tune_model(model=None,
             # Log model parameters
 
             try:   
-                params = best_model.get_params()
-
-                for i in list(params):
-                    v = params.get(i)
-                    if len(str(v)) > 250:
-                        params.pop(i)
+                params = {k: v for k, v in best_model.get_params().items() if len(str(v)) <= 250}
 
                 mlflow.log_params(params)
             except:
@@ -3383,8 +3377,8 @@ def tune_model(model=None,
             input_example = data_.iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
     
@@ -3435,6 +3429,8 @@ def save_model(model, model_name, model_only=False, verbose=True):
     import logging
     from copy import deepcopy
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -3471,12 +3467,12 @@ def save_model(model, model_name, model_only=False, verbose=True):
         model_ = deepcopy(model)
         logger.warning("Only Model saved. Transformations in prep_pipe are ignored.")
     else:
-        model_ = deepcopy(prep_pipe)
-        model_.steps.append(['trained model',model]) 
+        from sklearn.pipeline import Pipeline
+        model_ = Pipeline(prep_pipe.steps + [['trained model', model]])
     
     import joblib
     model_name = model_name + '.pkl'
-    joblib.dump(model_, model_name)
+    joblib.dump(model_, model_name, compress=3)
     if verbose:
         print('Transformation Pipeline and Model Succesfully Saved')
 
@@ -3778,6 +3774,8 @@ def deploy_model(model,
     import sys
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -4023,6 +4021,11 @@ def get_logs(experiment_name = None, save = False):
 
     return runs
 
+#global variables accessible through get_config() and set_config()
+_config_variables = frozenset(['X', 'data_', 'seed', 'prep_pipe', 'prep_param',
+                               'n_jobs_param', 'html_param', 'exp_name_log',
+                               'logging_param', 'log_plots_param', 'USI'])
+
 def get_config(variable):
 
     """
@@ -4055,6 +4058,8 @@ def get_config(variable):
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -4078,43 +4083,12 @@ def get_config(variable):
         logger.addHandler(ch)
 
     logger.info("Initializing get_config()")
-    logger.info("""get_config(variable={})""".\
-        format(str(variable)))
-
-    if variable == 'X':
-        global_var = X
-    
-    if variable == 'data_':
-        global_var = data_
+    logger.info("get_config(variable=%s)", variable)
 
-    if variable == 'seed':
-        global_var = seed
+    if variable in _config_variables:
+        global_var = globals()[variable]
 
-    if variable == 'prep_pipe':
-        global_var = prep_pipe
-
-    if variable == 'prep_param':
-        global_var = prep_param
-        
-    if variable == 'n_jobs_param':
-        global_var = n_jobs_param
-
-    if variable == 'html_param':
-        global_var = html_param
-
-    if variable == 'exp_name_log':
-        global_var = exp_name_log
-
-    if variable == 'logging_param':
-        global_var = logging_param
-
-    if variable == 'log_plots_param':
-        global_var = log_plots_param
-
-    if variable == 'USI':
-        global_var = USI
-
-    logger.info("Global variable: " + str(variable) + ' returned')
+    logger.info("Global variable: %s returned", variable)
     logger.info("get_config() succesfully completed......................................")
 
     return global_var
@@ -4147,6 +4121,8 @@ def set_config(variable,value):
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -4170,54 +4146,12 @@ def set_config(variable,value):
         logger.addHandler(ch)
         
     logger.info("Initializing set_config()")
-    logger.info("""set_config(variable={}, value={})""".\
-        format(str(variable), str(value)))
-
-    if variable == 'X':
-        global X
-        X = value
-
-    if variable == 'data_':
-        global data_
-        data_ = value
-
-    if variable == 'seed':
-        global seed
-        seed = value
-
-    if variable == 'prep_pipe':
-        global prep_pipe
-        prep_pipe = value
-
-    if variable == 'prep_param':
-        global prep_param
-        prep_param = value
-
-    if variable == 'n_jobs_param':
-        global n_jobs_param
-        n_jobs_param = value
-
-    if variable == 'html_param':
-        global html_param
-        html_param = value
-
-    if variable == 'exp_name_log':
-        global exp_name_log
-        exp_name_log = value
-
-    if variable == 'logging_param':
-        global logging_param
-        logging_param = value
-
-    if variable == 'log_plots_param':
-        global log_plots_param
-        log_plots_param = value
+    logger.info("set_config(variable=%s, value=%s)", variable, value)
 
-    if variable == 'USI':
-        global USI
-        USI = value
+    if variable in _config_variables:
+        globals()[variable] = value
 
-    logger.info("Global variable:  " + str(variable) + ' updated')
+    logger.info("Global variable: %s updated", variable)
     logger.info("set_config() succesfully completed......................................")
 
 def get_system_logs():
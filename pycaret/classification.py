@@ -1917,6 +1917,8 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -2202,10 +2204,8 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
                          'rf', 'qda', 'ada', 'gbc', 'lda', 
                          'et', 'xgboost', 'lightgbm', 'catboost']
     
-    model_library_str_ = ['lr', 'knn', 'nb', 'dt', 'svm', 
-                          'rbfsvm', 'gpc', 'mlp', 'ridge', 
-                          'rf', 'qda', 'ada', 'gbc', 'lda', 
-                          'et', 'xgboost', 'lightgbm', 'catboost']
+    #lookup of model id to (estimator, display name)
+    model_index = dict(zip(model_library_str, zip(model_library, model_names)))
     
     if exclude is not None:
         
@@ -2217,23 +2217,14 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
         else:
             exclude = exclude
         
-        for i in exclude:
-            model_library_str_.remove(i)
-        
-        si = []
-        
-        for i in model_library_str_:
-            s = model_library_str.index(i)
-            si.append(s)
-        
-        model_library_ = []
-        model_names_= []
-        for i in si:
-            model_library_.append(model_library[i])
-            model_names_.append(model_names[i])
-            
-        model_library = model_library_
-        model_names = model_names_
+        exclude_ = set(exclude)
+
+        model_library = []
+        model_names = []
+        for i in model_library_str:
+            if i not in exclude_:
+                model_library.append(model_index[i][0])
+                model_names.append(model_index[i][1])
         
         
     if exclude is None and turbo is True:
@@ -2263,60 +2254,9 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
         model_names = []
 
         for i in include:
-            if i == 'lr':
-                model_library.append(lr)
-                model_names.append('Logistic Regression')
-            elif i == 'knn':
-                model_library.append(knn)
-                model_names.append('K Neighbors Classifier')                
-            elif i == 'nb':
-                model_library.append(nb)
-                model_names.append('Naive Bayes')   
-            elif i == 'dt':
-                model_library.append(dt)
-                model_names.append('Decision Tree Classifier')   
-            elif i == 'svm':
-                model_library.append(svm)
-                model_names.append('SVM - Linear Kernel')   
-            elif i == 'rbfsvm':
-                model_library.append(rbfsvm)
-                model_names.append('SVM - Radial Kernel')
-            elif i == 'gpc':
-                model_library.append(gpc)
-                model_names.append('Gaussian Process Classifier')   
-            elif i == 'mlp':
-                model_library.append(mlp)
-                model_names.append('MLP Classifier')   
-            elif i == 'ridge':
-                model_library.append(ridge)
-                model_names.append('Ridge Classifier')   
-            elif i == 'rf':
-                model_library.append(rf)
-                model_names.append('Random Forest Classifier')   
-            elif i == 'qda':
-                model_library.append(qda)
-                model_names.append('Quadratic Discriminant Analysis')   
-            elif i == 'ada':
-                model_library.append(ada)
-                model_names.append('Ada Boost Classifier')   
-            elif i == 'gbc':
-                model_library.append(gbc)
-                model_names.append('Gradient Boosting Classifier')   
-            elif i == 'lda':
-                model_library.append(lda)
-                model_names.append('Linear Discriminant Analysis')   
-            elif i == 'et':
-                model_library.append(et)
-                model_names.append('Extra Trees Classifier')   
-            elif i == 'xgboost':
-                model_library.append(xgboost)
-                model_names.append('Extreme Gradient Boosting') 
-            elif i == 'lightgbm':
-                model_library.append(lightgbm)
-                model_names.append('Light Gradient Boosting Machine') 
-            elif i == 'catboost':
-                model_library.append(catboost)
-                model_names.append('CatBoost Classifier')   
+            if i in model_index:
+                model_library.append(model_index[i][0])
+                model_names.append(model_index[i][1])
 
     #multiclass check
     # this section is no more needed as all classifiers in sklearn supports multiclass by default
@@ -2380,6 +2320,8 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
     if budget_time and budget_time > 0:
         logger.info(f"Time budget is {budget_time} minutes")
 
+    multiclass = y.value_counts().count() > 2
+
     for model in model_library:
 
         logger.info("Initializing " + str(model_names[name_counter]))
@@ -2462,7 +2404,7 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
                 pred_ = model.predict(Xtest)
                 sca = metrics.accuracy_score(ytest,pred_)
 
-                if y.value_counts().count() > 2:
+                if multiclass:
                     sc = 0
                     recall = metrics.recall_score(ytest,pred_, average='macro')                
                     precision = metrics.precision_score(ytest,pred_, average = 'weighted')
@@ -2488,18 +2430,15 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
                 pred_ = model.predict(Xtest)
                 sca = metrics.accuracy_score(ytest,pred_)
 
-                if y.value_counts().count() > 2:
+                if multiclass:
                     sc = 0
                     recall = metrics.recall_score(ytest,pred_, average='macro')                
                     precision = metrics.precision_score(ytest,pred_, average = 'weighted')
                     f1 = metrics.f1_score(ytest,pred_, average='weighted')
 
                 else:
-                    try:
-                        sc = metrics.roc_auc_score(ytest,pred_prob)
-                    except:
-                        sc = 0
-                        logger.warning("model has no predict_proba attribute. AUC set to 0.00")
+                    sc = 0
+                    logger.warning("model has no predict_proba attribute. AUC set to 0.00")
                     recall = metrics.recall_score(ytest,pred_)                
                     precision = metrics.precision_score(ytest,pred_)
                     f1 = metrics.f1_score(ytest,pred_)
@@ -2597,12 +2536,7 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
                 # Get active run to log as tag
                 RunID = mlflow.active_run().info.run_id
 
-                params = model.get_params()
-
-                for i in list(params):
-                    v = params.get(i)
-                    if len(str(v)) > 250:
-                        params.pop(i)
+                params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
                         
                 mlflow.log_params(params)
 
@@ -2624,7 +2558,6 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
                 mlflow.log_metric("TT", avg_training_time[0])
 
                 # Log model and transformation pipeline
-                from copy import deepcopy
 
                 # get default conda env
                 from mlflow.sklearn import get_default_conda_env
@@ -2645,8 +2578,8 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
                 input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
                 # log model as sklearn flavor
-                prep_pipe_temp = deepcopy(prep_pipe)
-                prep_pipe_temp.steps.append(['trained model', model])
+                from sklearn.pipeline import Pipeline
+                prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
                 mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
                 del(prep_pipe_temp)
 
@@ -2870,6 +2803,8 @@ def create_model(estimator = None,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -3174,7 +3109,7 @@ def create_model(estimator = None,
         model = estimator
 
         def get_model_name(e):
-            return str(e).split("(")[0]
+            return type(e).__name__
 
         model_dict_logging = {'ExtraTreesClassifier' : 'Extra Trees Classifier',
                             'GradientBoostingClassifier' : 'Gradient Boosting Classifier', 
@@ -3199,9 +3134,6 @@ def create_model(estimator = None,
 
         mn = get_model_name(estimator)
 
-        if 'catboost' in mn:
-            mn = 'CatBoostClassifier'
-
         if mn in model_dict_logging.keys():
             full_name = model_dict_logging.get(mn)
         else:
@@ -3287,6 +3219,8 @@ def create_model(estimator = None,
     
     fold_num = 1
     
+    multiclass = y.value_counts().count() > 2
+
     for train_i , test_i in kf.split(data_X,data_y):
 
         logger.info("Initializing Fold " + str(fold_num))
@@ -3335,7 +3269,7 @@ def create_model(estimator = None,
             pred_ = model.predict(Xtest)
             sca = metrics.accuracy_score(ytest,pred_)
             
-            if y.value_counts().count() > 2:
+            if multiclass:
                 sc = 0
                 recall = metrics.recall_score(ytest,pred_, average='macro')                
                 precision = metrics.precision_score(ytest,pred_, average = 'weighted')
@@ -3359,18 +3293,15 @@ def create_model(estimator = None,
             pred_ = model.predict(Xtest)
             sca = metrics.accuracy_score(ytest,pred_)
             
-            if y.value_counts().count() > 2:
+            if multiclass:
                 sc = 0
                 recall = metrics.recall_score(ytest,pred_, average='macro')                
                 precision = metrics.precision_score(ytest,pred_, average = 'weighted')
                 f1 = metrics.f1_score(ytest,pred_, average='weighted')
 
             else:
-                try:
-                    sc = metrics.roc_auc_score(ytest,pred_prob)
-                except:
-                    sc = 0
-                    logger.warning("model has no predict_proba attribute. AUC to 0.00")
+                sc = 0
+                logger.warning("model has no predict_proba attribute. AUC to 0.00")
                 recall = metrics.recall_score(ytest,pred_)                
                 precision = metrics.precision_score(ytest,pred_)
                 f1 = metrics.f1_score(ytest,pred_)
@@ -3501,7 +3432,7 @@ def create_model(estimator = None,
     model_results = model_results.round(round)
     
     # yellow the mean
-    model_results=model_results.style.apply(lambda x: ['background: yellow' if (x.name == 'Mean') else '' for i in x], axis=1)
+    model_results=model_results.style.apply(lambda x: ['background: yellow'] * len(x), axis=1, subset=pd.IndexSlice[['Mean'], :])
     model_results = model_results.set_precision(round)
 
     #refitting the model on complete X_train, y_train
@@ -3564,12 +3495,7 @@ def create_model(estimator = None,
             RunID = mlflow.active_run().info.run_id
 
             # Log model parameters
-            params = model.get_params()
-
-            for i in list(params):
-                v = params.get(i)
-                if len(str(v)) > 250:
-                    params.pop(i)
+            params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
 
             mlflow.log_params(params)
             
@@ -3634,7 +3560,6 @@ def create_model(estimator = None,
                 logger.info("SubProcess plot_model() end ==================================")
             
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -3655,8 +3580,8 @@ def create_model(estimator = None,
             input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
 
@@ -3785,6 +3710,8 @@ def tune_model(estimator = None,
     '''
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -3979,7 +3906,7 @@ def tune_model(estimator = None,
     
     logger.info("Checking base model")
     def get_model_name(e):
-        return str(e).split("(")[0]
+        return type(e).__name__
 
     # this section is no more needed as all classifiers in sklearn supports multiclass by default
     """
@@ -3991,9 +3918,6 @@ def tune_model(estimator = None,
 
     mn = get_model_name(estimator)
 
-    if 'catboost' in mn:
-        mn = 'CatBoostClassifier'
-    
     model_dict = {'ExtraTreesClassifier' : 'et',
                 'GradientBoostingClassifier' : 'gbc', 
                 'RandomForestClassifier' : 'rf',
@@ -4553,6 +4477,8 @@ def tune_model(estimator = None,
     
     fold_num = 1
     
+    multiclass = y.value_counts().count() > 2
+
     for train_i , test_i in kf.split(data_X,data_y):
         
         logger.info("Initializing Fold " + str(fold_num))
@@ -4602,7 +4528,7 @@ def tune_model(estimator = None,
             pred_ = model.predict(Xtest)
             sca = metrics.accuracy_score(ytest,pred_)
             
-            if y.value_counts().count() > 2:
+            if multiclass:
                 sc = 0
                 recall = metrics.recall_score(ytest,pred_, average='macro')                
                 precision = metrics.precision_score(ytest,pred_, average = 'weighted')
@@ -4627,18 +4553,15 @@ def tune_model(estimator = None,
             pred_ = model.predict(Xtest)
             sca = metrics.accuracy_score(ytest,pred_)
             
-            if y.value_counts().count() > 2:
+            if multiclass:
                 sc = 0
                 recall = metrics.recall_score(ytest,pred_, average='macro')                
                 precision = metrics.precision_score(ytest,pred_, average = 'weighted')
                 f1 = metrics.f1_score(ytest,pred_, average='weighted')
 
             else:
-                try:
-                    sc = metrics.roc_auc_score(ytest,pred_prob)
-                except:
-                    sc = 0
-                    logger.warning("model has no predict_proba attribute. AUC set to 0.00")
+                sc = 0
+                logger.warning("model has no predict_proba attribute. AUC set to 0.00")
                 recall = metrics.recall_score(ytest,pred_)                
                 precision = metrics.precision_score(ytest,pred_)
                 f1 = metrics.f1_score(ytest,pred_)
@@ -4775,7 +4698,7 @@ def tune_model(estimator = None,
     model_results = model_results.round(round)
     
     # yellow the mean
-    model_results=model_results.style.apply(lambda x: ['background: yellow' if (x.name == 'Mean') else '' for i in x], axis=1)
+    model_results=model_results.style.apply(lambda x: ['background: yellow'] * len(x), axis=1, subset=pd.IndexSlice[['Mean'], :])
     model_results = model_results.set_precision(round)
 
     progress.value += 1
@@ -4882,15 +4805,8 @@ def tune_model(estimator = None,
             # Get active run to log as tag
             RunID = mlflow.active_run().info.run_id
 
-            params = best_model.get_params()
-
             # Log model parameters
-            params = model.get_params()
-
-            for i in list(params):
-                v = params.get(i)
-                if len(str(v)) > 250:
-                    params.pop(i)
+            params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
 
             mlflow.log_params(params)
 
@@ -4961,7 +4877,6 @@ def tune_model(estimator = None,
             os.remove('Iterations.html')
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -4982,8 +4897,8 @@ def tune_model(estimator = None,
             input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
         
@@ -5096,6 +5011,8 @@ def ensemble_model(estimator,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -5246,7 +5163,7 @@ def ensemble_model(estimator,
     logger.info("Checking base model")
 
     def get_model_name(e):
-        return str(e).split("(")[0]
+        return type(e).__name__
 
     # this section is no more needed as all classifiers in sklearn supports multiclass by default
     '''
@@ -5382,6 +5299,8 @@ def ensemble_model(estimator,
     
     fold_num = 1 
     
+    multiclass = y.value_counts().count() > 2
+
     for train_i , test_i in kf.split(data_X,data_y):
 
         logger.info("Initializing Fold " + str(fold_num))
@@ -5429,7 +5348,7 @@ def ensemble_model(estimator,
             pred_ = model.predict(Xtest)
             sca = metrics.accuracy_score(ytest,pred_)
             
-            if y.value_counts().count() > 2:
+            if multiclass:
                 sc = 0
                 recall = metrics.recall_score(ytest,pred_, average='macro')                
                 precision = metrics.precision_score(ytest,pred_, average = 'weighted')
@@ -5453,18 +5372,15 @@ def ensemble_model(estimator,
             pred_ = model.predict(Xtest)
             sca = metrics.accuracy_score(ytest,pred_)
             
-            if y.value_counts().count() > 2:
+            if multiclass:
                 sc = 0
                 recall = metrics.recall_score(ytest,pred_, average='macro')                
                 precision = metrics.precision_score(ytest,pred_, average = 'weighted')
                 f1 = metrics.f1_score(ytest,pred_, average='weighted')
 
             else:
-                try:
-                    sc = metrics.roc_auc_score(ytest,pred_prob)
-                except:
-                    sc = 0
-                    logger.warning("model has no predict_proba attribute. AUC set to 0.00")
+                sc = 0
+                logger.warning("model has no predict_proba attribute. AUC set to 0.00")
                 recall = metrics.recall_score(ytest,pred_)                
                 precision = metrics.precision_score(ytest,pred_)
                 f1 = metrics.f1_score(ytest,pred_)
@@ -5597,7 +5513,7 @@ def ensemble_model(estimator,
     model_results = model_results.round(round)  
     
     # yellow the mean
-    model_results=model_results.style.apply(lambda x: ['background: yellow' if (x.name == 'Mean') else '' for i in x], axis=1)
+    model_results=model_results.style.apply(lambda x: ['background: yellow'] * len(x), axis=1, subset=pd.IndexSlice[['Mean'], :])
     model_results = model_results.set_precision(round)
 
     progress.value += 1
@@ -5703,12 +5619,7 @@ def ensemble_model(estimator,
             # Get active run to log as tag
             RunID = mlflow.active_run().info.run_id
 
-            params = model.get_params()
-
-            for i in list(params):
-                v = params.get(i)
-                if len(str(v)) > 250:
-                    params.pop(i)
+            params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
 
             mlflow.log_params(params)
             mlflow.log_metrics({"Accuracy": avgs_acc[0], "AUC": avgs_auc[0], "Recall": avgs_recall[0], "Precision" : avgs_precision[0],
@@ -5770,7 +5681,6 @@ def ensemble_model(estimator,
             os.remove('Results.html')
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -5791,8 +5701,8 @@ def ensemble_model(estimator,
             input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
 
@@ -5922,6 +5832,8 @@ def blend_models(estimator_list = 'All',
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -6291,6 +6203,8 @@ def blend_models(estimator_list = 'All',
     
     fold_num = 1
     
+    multiclass = y.value_counts().count() > 2
+
     for train_i , test_i in kf.split(data_X,data_y):
         
         logger.info("Initializing Fold " + str(fold_num))
@@ -6339,7 +6253,7 @@ def blend_models(estimator_list = 'All',
             pred_ = model.predict(Xtest)
             sca = metrics.accuracy_score(ytest,pred_)
             sc = 0.0
-            if y.value_counts().count() > 2:
+            if multiclass:
                 recall = metrics.recall_score(ytest,pred_, average='macro')
                 precision = metrics.precision_score(ytest,pred_, average='weighted')
                 f1 = metrics.f1_score(ytest,pred_, average='weighted')    
@@ -6355,7 +6269,7 @@ def blend_models(estimator_list = 'All',
             pred_ = model.predict(Xtest)
             sca = metrics.accuracy_score(ytest,pred_)
             
-            if y.value_counts().count() > 2:
+            if multiclass:
                 pred_prob = 0
                 sc = 0
                 recall = metrics.recall_score(ytest,pred_, average='macro')
@@ -6491,7 +6405,7 @@ def blend_models(estimator_list = 'All',
     model_results = model_results.round(round)
     
     # yellow the mean
-    model_results=model_results.style.apply(lambda x: ['background: yellow' if (x.name == 'Mean') else '' for i in x], axis=1)
+    model_results=model_results.style.apply(lambda x: ['background: yellow'] * len(x), axis=1, subset=pd.IndexSlice[['Mean'], :])
     model_results = model_results.set_precision(round)
 
     progress.value += 1
@@ -6649,7 +6563,6 @@ def blend_models(estimator_list = 'All',
             os.remove('Results.html')
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -6670,8 +6583,8 @@ def blend_models(estimator_list = 'All',
             input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
 
@@ -6794,6 +6707,8 @@ def stack_models(estimator_list,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -6969,40 +6884,12 @@ def stack_models(estimator_list,
     data_X.reset_index(drop=True, inplace=True)
     data_y.reset_index(drop=True, inplace=True)
     
-    logger.info("Getting model names")
-    #defining model_library model names
-    model_names = np.zeros(0)
-    for item in estimator_list:
-        model_names = np.append(model_names, str(item).split("(")[0])
-     
-    model_names_fixed = []
-    
-    for i in model_names:
-        if 'CatBoostClassifier' in i:
-            a = 'CatBoostClassifier'
-            model_names_fixed.append(a)
-        else:
-            model_names_fixed.append(i)
-            
-    model_names = model_names_fixed
-    
-    model_names_fixed = []
-
-    counter = 0
-    for i in model_names:
-        s = str(i) + '_' + str(counter)
-        model_names_fixed.append(s)
-        counter += 1
-
     logger.info("Compiling estimator_list parameter")
 
-    counter = 0
-    
+    #name each estimator by class with a positional suffix to keep names unique
     estimator_list_tuples = []
-    
-    for i in estimator_list:
-        estimator_list_tuples.append(tuple([model_names_fixed[counter], estimator_list[counter]]))
-        counter += 1
+    for counter, item in enumerate(estimator_list):
+        estimator_list_tuples.append((type(item).__name__ + '_' + str(counter), item))
 
     logger.info("Creating StackingClassifier()")
 
@@ -7014,6 +6901,8 @@ def stack_models(estimator_list,
 
     fold_num = 1
     
+    multiclass = y.value_counts().count() > 2
+
     for train_i , test_i in kf.split(data_X,data_y):
 
         logger.info("Initializing Fold " + str(fold_num))
@@ -7065,7 +6954,7 @@ def stack_models(estimator_list,
         pred_ = model.predict(Xtest)
         sca = metrics.accuracy_score(ytest,pred_)
         
-        if y.value_counts().count() > 2:
+        if multiclass:
             sc = 0
             recall = metrics.recall_score(ytest,pred_, average='macro')                
             precision = metrics.precision_score(ytest,pred_, average = 'weighted')
@@ -7206,7 +7095,7 @@ def stack_models(estimator_list,
     model_results = model_results.round(round)
     
     # yellow the mean
-    model_results=model_results.style.apply(lambda x: ['background: yellow' if (x.name == 'Mean') else '' for i in x], axis=1)
+    model_results=model_results.style.apply(lambda x: ['background: yellow'] * len(x), axis=1, subset=pd.IndexSlice[['Mean'], :])
     model_results = model_results.set_precision(round)
 
     #refitting the model on complete X_train, y_train
@@ -7332,12 +7221,7 @@ def stack_models(estimator_list,
             # Get active run to log as tag
             RunID = mlflow.active_run().info.run_id
 
-            params = model.get_params()
-
-            for i in list(params):
-                v = params.get(i)
-                if len(str(v)) > 250:
-                    params.pop(i)
+            params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
             
             try:
                 mlflow.log_params(params)
@@ -7403,7 +7287,6 @@ def stack_models(estimator_list,
                 logger.info("SubProcess plot_model() end ==================================")
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -7424,8 +7307,8 @@ def stack_models(estimator_list,
             input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
 
@@ -7539,6 +7422,8 @@ def plot_model(estimator,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -8035,12 +7920,7 @@ def plot_model(estimator,
             param_name='C'
             param_range = np.arange(1,11)
             
-        #Bagging / Boosting 
-        elif hasattr(model, 'n_estimators'):
-            param_name='n_estimators'
-            param_range = np.arange(1,100,10)   
-            
-        #Bagging / Boosting / gbc / ada / 
+        #Bagging / Boosting / gbc / ada
         elif hasattr(model, 'n_estimators'):
             param_name='n_estimators'
             param_range = np.arange(1,100,10)   
@@ -8308,6 +8188,8 @@ def interpret_model(estimator,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -8593,6 +8475,8 @@ def calibrate_model(estimator,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -8708,7 +8592,7 @@ def calibrate_model(estimator,
     logger.info("Getting model name")
 
     def get_model_name(e):
-        return str(e).split("(")[0]
+        return type(e).__name__
 
 
     if hasattr(estimator, 'voting'):
@@ -8716,9 +8600,6 @@ def calibrate_model(estimator,
     else:
         mn = get_model_name(estimator)
 
-    if 'catboost' in mn:
-        mn = 'CatBoostClassifier' 
-
     model_dict_logging = {'ExtraTreesClassifier' : 'Extra Trees Classifier',
                         'GradientBoostingClassifier' : 'Gradient Boosting Classifier', 
                         'RandomForestClassifier' : 'Random Forest Classifier',
@@ -8804,6 +8685,8 @@ def calibrate_model(estimator,
     
     fold_num = 1
     
+    multiclass = y.value_counts().count() > 2
+
     for train_i , test_i in kf.split(data_X,data_y):
 
         logger.info("Initializing Fold " + str(fold_num))
@@ -8854,7 +8737,7 @@ def calibrate_model(estimator,
             pred_ = model.predict(Xtest)
             sca = metrics.accuracy_score(ytest,pred_)
             
-            if y.value_counts().count() > 2:
+            if multiclass:
                 sc = 0
                 recall = metrics.recall_score(ytest,pred_, average='macro')                
                 precision = metrics.precision_score(ytest,pred_, average = 'weighted')
@@ -8877,17 +8760,14 @@ def calibrate_model(estimator,
             pred_ = model.predict(Xtest)
             sca = metrics.accuracy_score(ytest,pred_)
             
-            if y.value_counts().count() > 2:
+            if multiclass:
                 sc = 0
                 recall = metrics.recall_score(ytest,pred_, average='macro')                
                 precision = metrics.precision_score(ytest,pred_, average = 'weighted')
                 f1 = metrics.f1_score(ytest,pred_, average='weighted')
 
             else:
-                try:
-                    sc = metrics.roc_auc_score(ytest,pred_prob)
-                except:
-                    sc = 0
+                sc = 0
                 recall = metrics.recall_score(ytest,pred_)                
                 precision = metrics.precision_score(ytest,pred_)
                 f1 = metrics.f1_score(ytest,pred_)
@@ -9014,7 +8894,7 @@ def calibrate_model(estimator,
     model_results = model_results.round(round)
     
     # yellow the mean
-    model_results=model_results.style.apply(lambda x: ['background: yellow' if (x.name == 'Mean') else '' for i in x], axis=1)
+    model_results=model_results.style.apply(lambda x: ['background: yellow'] * len(x), axis=1, subset=pd.IndexSlice[['Mean'], :])
     model_results=model_results.set_precision(round)
     
     #refitting the model on complete X_train, y_train
@@ -9087,12 +8967,7 @@ def calibrate_model(estimator,
             RunID = mlflow.active_run().info.run_id
 
             # Log model parameters
-            params = model.get_params()
-            
-            for i in list(params):
-                v = params.get(i)
-                if len(str(v)) > 250:
-                    params.pop(i)
+            params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
 
             mlflow.log_params(params)
             
@@ -9157,7 +9032,6 @@ def calibrate_model(estimator,
                 logger.info("SubProcess plot_model() end ==================================")
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -9178,8 +9052,8 @@ def calibrate_model(estimator,
             input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
 
@@ -9255,6 +9129,8 @@ def optimize_threshold(estimator,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -9736,6 +9612,8 @@ def finalize_model(estimator):
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -9781,7 +9659,7 @@ def finalize_model(estimator):
     
     #determine runname for logging
     def get_model_name(e):
-        return str(e).split("(")[0]
+        return type(e).__name__
     
     model_dict_logging = {'ExtraTreesClassifier' : 'Extra Trees Classifier',
                             'GradientBoostingClassifier' : 'Gradient Boosting Classifier', 
@@ -9816,9 +9694,6 @@ def finalize_model(estimator):
     if 'CalibratedClassifierCV' in mn:
         mn = get_model_name(estimator.base_estimator)
 
-    if 'catboost' in mn:
-        mn = 'CatBoostClassifier'
-
     full_name = model_dict_logging.get(mn)
     
     logger.info("Finalizing " + str(full_name))
@@ -9852,12 +9727,7 @@ def finalize_model(estimator):
 
             # Log model parameters
             try:
-                params = model_final.get_params()
-
-                for i in list(params):
-                    v = params.get(i)
-                    if len(str(v)) > 250:
-                        params.pop(i)
+                params = {k: v for k, v in model_final.get_params().items() if len(str(v)) <= 250}
 
                 mlflow.log_params(params)
             
@@ -9867,9 +9737,9 @@ def finalize_model(estimator):
             # get metrics of non-finalized model and log it
 
             # Log metrics
-            mlflow.log_metrics({"Accuracy": results.iloc[-2]['Accuracy'], "AUC": results.iloc[-2]['AUC'], "Recall": results.iloc[-2]['Recall'],\
-                                "Precision" : results.iloc[-2]['Prec.'], "F1": results.iloc[-2]['F1'], "Kappa": results.iloc[-2]['Kappa'],\
-                                "MCC": results.iloc[-2]['MCC']})
+            mlflow.log_metrics({"Accuracy": results.at['Mean', 'Accuracy'], "AUC": results.at['Mean', 'AUC'], "Recall": results.at['Mean', 'Recall'],\
+                                "Precision" : results.at['Mean', 'Prec.'], "F1": results.at['Mean', 'F1'], "Kappa": results.at['Mean', 'Kappa'],\
+                                "MCC": results.at['Mean', 'MCC']})
 
             #set tag of compare_models
             mlflow.set_tag("Source", "finalize_model")
@@ -9916,7 +9786,6 @@ def finalize_model(estimator):
                 logger.info("SubProcess plot_model() end ==================================")
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -9936,8 +9805,8 @@ def finalize_model(estimator):
                 signature = None
             
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model_final])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model_final]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature)
             del(prep_pipe_temp)
 
@@ -10050,6 +9919,8 @@ def deploy_model(model,
     import sys
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -10221,6 +10092,8 @@ def create_webservice(model, model_endopoint, api_key=True,
     """
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -10422,6 +10295,8 @@ def save_model(model, model_name, model_only=False, verbose=True):
     import logging
     from copy import deepcopy
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -10458,12 +10333,12 @@ def save_model(model, model_name, model_only=False, verbose=True):
         model_ = deepcopy(model)
         logger.warning("Only Model saved. Transformations in prep_pipe are ignored.")
     else:
-        model_ = deepcopy(prep_pipe)
-        model_.steps.append(['trained model',model]) 
+        from sklearn.pipeline import Pipeline
+        model_ = Pipeline(prep_pipe.steps + [['trained model', model]])
     
     import joblib
     model_name = model_name + '.pkl'
-    joblib.dump(model_, model_name)
+    joblib.dump(model_, model_name, compress=3)
     if verbose:
         print('Transformation Pipeline and Model Succesfully Saved')
     
@@ -10603,6 +10478,8 @@ def automl(optimize='Accuracy', use_holdout=False):
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -10827,6 +10704,16 @@ def get_logs(experiment_name = None, save = False):
 
     return runs
 
+#global variables accessible through get_config() and set_config()
+_config_variables = frozenset(['X', 'y', 'X_train', 'X_test', 'y_train', 'y_test',
+                               'seed', 'prep_pipe', 'folds_shuffle_param',
+                               'n_jobs_param', 'html_param', 'create_model_container',
+                               'master_model_container', 'display_container',
+                               'exp_name_log', 'logging_param', 'log_plots_param',
+                               'USI', 'fix_imbalance_param',
+                               'fix_imbalance_method_param', 'data_before_preprocess',
+                               'target_param', 'gpu_param'])
+
 def get_config(variable):
 
     """
@@ -10871,6 +10758,8 @@ def get_config(variable):
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -10894,79 +10783,12 @@ def get_config(variable):
         logger.addHandler(ch)
 
     logger.info("Initializing get_config()")
-    logger.info("""get_config(variable={})""".\
-        format(str(variable)))
-
-    if variable == 'X':
-        global_var = X
-    
-    if variable == 'y':
-        global_var = y
-
-    if variable == 'X_train':
-        global_var = X_train
-
-    if variable == 'X_test':
-        global_var = X_test
+    logger.info("get_config(variable=%s)", variable)
 
-    if variable == 'y_train':
-        global_var = y_train
+    if variable in _config_variables:
+        global_var = globals()[variable]
 
-    if variable == 'y_test':
-        global_var = y_test
-
-    if variable == 'seed':
-        global_var = seed
-
-    if variable == 'prep_pipe':
-        global_var = prep_pipe
-
-    if variable == 'folds_shuffle_param':
-        global_var = folds_shuffle_param
-        
-    if variable == 'n_jobs_param':
-        global_var = n_jobs_param
-
-    if variable == 'html_param':
-        global_var = html_param
-
-    if variable == 'create_model_container':
-        global_var = create_model_container
-
-    if variable == 'master_model_container':
-        global_var = master_model_container
-
-    if variable == 'display_container':
-        global_var = display_container
-
-    if variable == 'exp_name_log':
-        global_var = exp_name_log
-
-    if variable == 'logging_param':
-        global_var = logging_param
-
-    if variable == 'log_plots_param':
-        global_var = log_plots_param
-
-    if variable == 'USI':
-        global_var = USI
-
-    if variable == 'fix_imbalance_param':
-        global_var = fix_imbalance_param
-
-    if variable == 'fix_imbalance_method_param':
-        global_var = fix_imbalance_method_param
-
-    if variable == 'data_before_preprocess':
-        global_var = data_before_preprocess
-
-    if variable == 'target_param':
-        global_var = target_param
-
-    if variable == 'gpu_param':
-        global_var = gpu_param
-
-    logger.info("Global variable: " + str(variable) + ' returned')
+    logger.info("Global variable: %s returned", variable)
     logger.info("get_config() succesfully completed......................................")
 
     return global_var
@@ -11011,6 +10833,8 @@ def set_config(variable,value):
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -11034,102 +10858,12 @@ def set_config(variable,value):
         logger.addHandler(ch)
 
     logger.info("Initializing set_config()")
-    logger.info("""set_config(variable={}, value={})""".\
-        format(str(variable), str(value)))
-
-    if variable == 'X':
-        global X
-        X = value
-
-    if variable == 'y':
-        global y
-        y = value
-
-    if variable == 'X_train':
-        global X_train
-        X_train = value
-
-    if variable == 'X_test':
-        global X_test
-        X_test = value
-
-    if variable == 'y_train':
-        global y_train
-        y_train = value
-
-    if variable == 'y_test':
-        global y_test
-        y_test = value
-
-    if variable == 'seed':
-        global seed
-        seed = value
-
-    if variable == 'prep_pipe':
-        global prep_pipe
-        prep_pipe = value
-
-    if variable == 'folds_shuffle_param':
-        global folds_shuffle_param
-        folds_shuffle_param = value
-
-    if variable == 'n_jobs_param':
-        global n_jobs_param
-        n_jobs_param = value
-
-    if variable == 'html_param':
-        global html_param
-        html_param = value
-
-    if variable == 'create_model_container':
-        global create_model_container
-        create_model_container = value
-
-    if variable == 'master_model_container':
-        global master_model_container
-        master_model_container = value
-
-    if variable == 'display_container':
-        global display_container
-        display_container = value
-
-    if variable == 'exp_name_log':
-        global exp_name_log
-        exp_name_log = value
-
-    if variable == 'logging_param':
-        global logging_param
-        logging_param = value
-
-    if variable == 'log_plots_param':
-        global log_plots_param
-        log_plots_param = value
-
-    if variable == 'USI':
-        global USI
-        USI = value
-
-    if variable == 'fix_imbalance_param':
-        global fix_imbalance_param
-        fix_imbalance_param = value
-
-    if variable == 'fix_imbalance_method_param':
-        global fix_imbalance_method_param
-        fix_imbalance_method_param = value
-
-    if variable == 'data_before_preprocess':
-        global data_before_preprocess
-        data_before_preprocess = value
-
-    if variable == 'target_param':
-        global target_param
-        target_param = value
+    logger.info("set_config(variable=%s, value=%s)", variable, value)
 
-    if variable == 'gpu_param':
-        global gpu_param
-        gpu_param = value
+    if variable in _config_variables:
+        globals()[variable] = value
 
-    logger.info("Global variable:  " + str(variable) + ' updated')
+    logger.info("Global variable: %s updated", variable)
     logger.info("set_config() succesfully completed......................................")
 
 def get_system_logs():
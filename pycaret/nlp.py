@@ -911,6 +911,8 @@ def create_model(model=None,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -1201,10 +1203,7 @@ def create_model(model=None,
                 import inspect
                 params = inspect.getmembers(model_copied)[2][1]
 
-            for i in list(params):
-                v = params.get(i)
-                if len(str(v)) > 250:
-                    params.pop(i)
+            params = {k: v for k, v in params.items() if len(str(v)) <= 250}
 
             mlflow.log_params(params)
 
@@ -1321,6 +1320,8 @@ def assign_model(model,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -1716,6 +1717,8 @@ def plot_model(model = None,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -2498,6 +2501,8 @@ def tune_model(model=None,
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -3481,6 +3486,8 @@ def save_model(model, model_name,
     """
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -3509,7 +3516,7 @@ def save_model(model, model_name,
 
     import joblib
     model_name = model_name + '.pkl'
-    joblib.dump(model, model_name)
+    joblib.dump(model, model_name, compress=3)
     if verbose:
         print('Model Succesfully Saved')
 
@@ -3641,6 +3648,16 @@ def get_logs(experiment_name = None, save = False):
         runs.to_csv(file_name, index=False)
     return runs
 
+#global variables accessible through get_config()
+_config_variables = frozenset(['text', 'data_', 'corpus', 'id2word', 'seed', 'target_',
+                               'html_param', 'exp_name_log', 'logging_param',
+                               'log_plots_param', 'USI'])
+
+#global variables accessible through set_config()
+_set_config_variables = frozenset(['text', 'data_', 'corpus', 'id2word', 'seed',
+                                   'html_param', 'exp_name_log', 'logging_param',
+                                   'log_plots_param', 'USI'])
+
 def get_config(variable):
 
     """
@@ -3673,6 +3690,8 @@ def get_config(variable):
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -3696,43 +3715,12 @@ def get_config(variable):
         logger.addHandler(ch)
 
     logger.info("Initializing get_config()")
-    logger.info("""get_config(variable={})""".\
-        format(str(variable)))
-
-    if variable == 'text':
-        global_var = text
-    
-    if variable == 'data_':
-        global_var = data_
-
-    if variable == 'corpus':
-        global_var = corpus
-        
-    if variable == 'id2word':
-        global_var = id2word
+    logger.info("get_config(variable=%s)", variable)
 
-    if variable == 'seed':
-        global_var = seed
+    if variable in _config_variables:
+        global_var = globals()[variable]
 
-    if variable == 'target_':
-        global_var = target_
-
-    if variable == 'html_param':
-        global_var = html_param
-
-    if variable == 'exp_name_log':
-        global_var = exp_name_log
-
-    if variable == 'logging_param':
-        global_var = logging_param
-
-    if variable == 'log_plots_param':
-        global_var = log_plots_param
-
-    if variable == 'USI':
-        global_var = USI
-
-    logger.info("Global variable: " + str(variable) + ' returned')
+    logger.info("Global variable: %s returned", variable)
     logger.info("get_config() succesfully completed......................................")
 
     return global_var
@@ -3765,6 +3753,8 @@ def set_config(variable,value):
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -3788,50 +3778,12 @@ def set_config(variable,value):
         logger.addHandler(ch)
 
     logger.info("Initializing set_config()")
-    logger.info("""set_config(variable={}, value={})""".\
-        format(str(variable), str(value)))
+    logger.info("set_config(variable=%s, value=%s)", variable, value)
         
-    if variable == 'text':
-        global text
-        text = value
-
-    if variable == 'data_':
-        global data_
-        data_ = value
-
-    if variable == 'corpus':
-        global corpus
-        corpus = value
-
-    if variable == 'id2word':
-        global id2word
-        id2word = value
-
-    if variable == 'seed':
-        global seed
-        seed = value
-
-    if variable == 'html_param':
-        global html_param
-        html_param = value
-
-    if variable == 'exp_name_log':
-        global exp_name_log
-        exp_name_log = value
-
-    if variable == 'logging_param':
-        global logging_param
-        logging_param = value
-
-    if variable == 'log_plots_param':
-        global log_plots_param
-        log_plots_param = value
-
-    if variable == 'USI':
-        global USI
-        USI = value
+    if variable in _set_config_variables:
+        globals()[variable] = value
 
-    logger.info("Global variable:  " + str(variable) + ' updated')
+    logger.info("Global variable: %s updated", variable)
     logger.info("set_config() succesfully completed......................................")
 
 def get_system_logs():
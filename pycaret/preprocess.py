@@ -397,17 +397,16 @@ class Simple_Imputer(BaseEstimator,TransformerMixin):
     #for Catgorical , 
     if self.categorical_strategy == 'most frequent':
       self.categorical_columns = data.drop(self.target,axis=1).select_dtypes(include=['object']).columns
-      self.categorical_stats = pd.DataFrame(columns=self.categorical_columns) # place holder
-      for i in (self.categorical_stats.columns):
-        self.categorical_stats.loc[0,i] = data[i].value_counts().index[0]
+      # build the single row of most frequent values in one go instead of growing it cell by cell
+      self.categorical_stats = pd.DataFrame({i: [data[i].value_counts().index[0]] for i in self.categorical_columns},
+                                            columns=self.categorical_columns)
     else:
       self.categorical_columns = data.drop(self.target,axis=1).select_dtypes(include=['object']).columns
     
     # for time, there is only one way, pick up the most frequent one
     self.time_columns = data.drop(self.target,axis=1).select_dtypes(include=['datetime64[ns]']).columns
-    self.time_stats = pd.DataFrame(columns=self.time_columns) # place holder
-    for i in (self.time_columns):
-      self.time_stats.loc[0,i] = data[i].value_counts().index[0]
+    self.time_stats = pd.DataFrame({i: [data[i].value_counts().index[0]] for i in self.time_columns},
+                                   columns=self.time_columns)
     return(data)
 
       
@@ -489,9 +488,8 @@ class Surrogate_Imputer(BaseEstimator,TransformerMixin):
     #for Catgorical , 
     if self.categorical_strategy == 'most frequent':
       self.categorical_columns = data.drop(self.target,axis=1).select_dtypes(include=['object']).columns
-      self.categorical_stats = pd.DataFrame(columns=self.categorical_columns) # place holder
-      for i in (self.categorical_stats.columns):
-        self.categorical_stats.loc[0,i] = data[i].value_counts().index[0]
+      self.categorical_stats = pd.DataFrame({i: [data[i].value_counts().index[0]] for i in self.categorical_columns},
+                                            columns=self.categorical_columns)
       # also need to learn if any columns had NA in training, but this is only valid if strategy is "most frequent"
       self.categorical_na = pd.DataFrame(columns=self.categorical_columns)
       for i in self.categorical_columns:
@@ -506,10 +504,9 @@ class Surrogate_Imputer(BaseEstimator,TransformerMixin):
     
     # for time, there is only one way, pick up the most frequent one
     self.time_columns = data.drop(self.target,axis=1).select_dtypes(include=['datetime64[ns]']).columns
-    self.time_stats = pd.DataFrame(columns=self.time_columns) # place holder
+    self.time_stats = pd.DataFrame({i: [data[i].value_counts().index[0]] for i in self.time_columns},
+                                   columns=self.time_columns)
     self.time_na = pd.DataFrame(columns=self.time_columns)
-    for i in (self.time_columns):
-      self.time_stats.loc[0,i] = data[i].value_counts().index[0]
     
     # learn if time columns were NA
     for i in self.time_columns:
@@ -1858,6 +1858,8 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -2168,9 +2170,8 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
                          'par', 'ransac', 'tr', 'huber', 'kr', 'svm', 'knn', 'dt', 'rf', 
                          'et', 'ada', 'gbr', 'mlp', 'xgboost', 'lightgbm', 'catboost']
     
-    model_library_str_ = ['lr', 'lasso', 'ridge', 'en', 'lar', 'llar', 'omp', 'br', 'ard',
-                         'par', 'ransac', 'tr', 'huber', 'kr', 'svm', 'knn', 'dt', 'rf', 
-                         'et', 'ada', 'gbr', 'mlp', 'xgboost', 'lightgbm', 'catboost']
+    #lookup of model id to (estimator, display name)
+    model_index = dict(zip(model_library_str, zip(model_library, model_names)))
     
     if exclude is not None:
         
@@ -2182,23 +2183,14 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
         else:
             exclude = exclude
         
-        for i in exclude:
-            model_library_str_.remove(i)
-        
-        si = []
-        
-        for i in model_library_str_:
-            s = model_library_str.index(i)
-            si.append(s)
-        
-        model_library_ = []
-        model_names_= []
-        for i in si:
-            model_library_.append(model_library[i])
-            model_names_.append(model_names[i])
-            
-        model_library = model_library_
-        model_names = model_names_
+        exclude_ = set(exclude)
+
+        model_library = []
+        model_names = []
+        for i in model_library_str:
+            if i not in exclude_:
+                model_library.append(model_index[i][0])
+                model_names.append(model_index[i][1])
         
         
     if exclude is None and turbo is True:
@@ -2236,81 +2228,9 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
         model_names = []
 
         for i in include:
-            if i == 'lr':
-                model_library.append(lr)
-                model_names.append('Linear Regression')
-            elif i == 'lasso':
-                model_library.append(lasso)
-                model_names.append('Lasso Regression')                
-            elif i == 'ridge':
-                model_library.append(ridge)
-                model_names.append('Ridge Regression')   
-            elif i == 'en':
-                model_library.append(en)
-                model_names.append('Elastic Net')   
-            elif i == 'lar':
-                model_library.append(lar)
-                model_names.append('Least Angle Regression')   
-            elif i == 'llar':
-                model_library.append(llar)
-                model_names.append('Lasso Least Angle Regression')
-            elif i == 'omp':
-                model_library.append(omp)
-                model_names.append('Orthogonal Matching Pursuit')   
-            elif i == 'br':
-                model_library.append(br)
-                model_names.append('Bayesian Ridge')
-            elif i == 'ard':
-                model_library.append(ard)
-                model_names.append('Automatic Relevance Determination')  
-            elif i == 'par':
-                model_library.append(par)
-                model_names.append('Passive Aggressive Regressor')
-            elif i == 'ransac':
-                model_library.append(ransac)
-                model_names.append('Random Sample Consensus')   
-            elif i == 'tr':
-                model_library.append(tr)
-                model_names.append('TheilSen Regressor')   
-            elif i == 'huber':
-                model_library.append(huber)
-                model_names.append('Huber Regressor')
-            elif i == 'kr':
-                model_library.append(kr)
-                model_names.append('Kernel Ridge')     
-            elif i == 'svm':
-                model_library.append(svm)
-                model_names.append('Support Vector Machine')   
-            elif i == 'knn':
-                model_library.append(knn)
-                model_names.append('K Neighbors Regressor')   
-            elif i == 'dt':
-                model_library.append(dt)
-                model_names.append('Decision Tree')   
-            elif i == 'rf':
-                model_library.append(rf)
-                model_names.append('Random Forest') 
-            elif i == 'et':
-                model_library.append(et)
-                model_names.append('Extra Trees Regressor') 
-            elif i == 'ada':
-                model_library.append(ada)
-                model_names.append('AdaBoost Regressor')  
-            elif i == 'gbr':
-                model_library.append(gbr)
-                model_names.append('Gradient Boosting Regressor')
-            elif i == 'mlp':
-                model_library.append(mlp)
-                model_names.append('Multi Level Perceptron')     
-            elif i == 'xgboost':
-                model_library.append(xgboost)
-                model_names.append('Extreme Gradient Boosting')   
-            elif i == 'lightgbm':
-                model_library.append(lightgbm)
-                model_names.append('Light Gradient Boosting Machine')   
-            elif i == 'catboost':
-                model_library.append(catboost)
-                model_names.append('CatBoost Regressor')   
+            if i in model_index:
+                model_library.append(model_index[i][0])
+                model_names.append(model_index[i][1])
             
     progress.value += 1
 
@@ -2542,12 +2462,7 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
                 # Get active run to log as tag
                 RunID = mlflow.active_run().info.run_id
 
-                params = model.get_params()
-
-                for i in list(params):
-                    v = params.get(i)
-                    if len(str(v)) > 250:
-                        params.pop(i)
+                params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
                         
                 mlflow.log_params(params)
 
@@ -2568,7 +2483,6 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
                 mlflow.log_metric("TT", avgs_training_time[0])
 
                 # Log model and transformation pipeline
-                from copy import deepcopy
 
                 # get default conda env
                 from mlflow.sklearn import get_default_conda_env
@@ -2589,8 +2503,8 @@ def compare_models(exclude = None, #changed blacklist to exclude in pycaret==2.1
                 input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
                 # log model as sklearn flavor
-                prep_pipe_temp = deepcopy(prep_pipe)
-                prep_pipe_temp.steps.append(['trained model', model])
+                from sklearn.pipeline import Pipeline
+                prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
                 mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
                 del(prep_pipe_temp)
 
@@ -2799,6 +2713,8 @@ def create_model(estimator = None,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -3136,7 +3052,7 @@ def create_model(estimator = None,
         model = estimator
         
         def get_model_name(e):
-            return str(e).split("(")[0]
+            return type(e).__name__
 
         model_dict_logging = {'ExtraTreesRegressor' : 'Extra Trees Regressor',
                             'GradientBoostingRegressor' : 'Gradient Boosting Regressor', 
@@ -3167,9 +3083,6 @@ def create_model(estimator = None,
 
         mn = get_model_name(estimator)
         
-        if 'catboost' in mn:
-            mn = 'CatBoostRegressor'
-
         if mn in model_dict_logging.keys():
             full_name = model_dict_logging.get(mn)
         else:
@@ -3390,7 +3303,7 @@ def create_model(estimator = None,
     model_results = model_results.round(round)
     
     #Yellow the mean
-    model_results=model_results.style.apply(lambda x: ['background: yellow' if (x.name == 'Mean') else '' for i in x], axis=1)
+    model_results=model_results.style.apply(lambda x: ['background: yellow'] * len(x), axis=1, subset=pd.IndexSlice[['Mean'], :])
     model_results = model_results.set_precision(round)
 
     #refitting the model on complete X_train, y_train
@@ -3438,12 +3351,7 @@ def create_model(estimator = None,
             RunID = mlflow.active_run().info.run_id
 
             # Log model parameters
-            params = model.get_params()
-
-            for i in list(params):
-                v = params.get(i)
-                if len(str(v)) > 250:
-                    params.pop(i)
+            params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
 
             mlflow.log_params(params)
             
@@ -3507,7 +3415,6 @@ def create_model(estimator = None,
                 logger.info("SubProcess plot_model() end ==================================")
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -3528,8 +3435,8 @@ def create_model(estimator = None,
             input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
 
@@ -3657,6 +3564,8 @@ def tune_model(estimator,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -3826,13 +3735,10 @@ def tune_model(estimator,
     logger.info("Checking base model")
 
     def get_model_name(e):
-        return str(e).split("(")[0]
+        return type(e).__name__
 
     mn = get_model_name(estimator)
 
-    if 'catboost' in mn:
-        mn = 'CatBoostRegressor'
-    
     model_dict = {'ExtraTreesRegressor' : 'et',
                 'GradientBoostingRegressor' : 'gbr', 
                 'RandomForestRegressor' : 'rf',
@@ -4735,7 +4641,7 @@ def tune_model(estimator,
     model_results = model_results.round(round)
     
     # yellow the mean
-    model_results=model_results.style.apply(lambda x: ['background: yellow' if (x.name == 'Mean') else '' for i in x], axis=1)
+    model_results=model_results.style.apply(lambda x: ['background: yellow'] * len(x), axis=1, subset=pd.IndexSlice[['Mean'], :])
     model_results = model_results.set_precision(round)
 
     progress.value += 1
@@ -4831,15 +4737,8 @@ def tune_model(estimator,
             # Get active run to log as tag
             RunID = mlflow.active_run().info.run_id
 
-            params = best_model.get_params()
-
             # Log model parameters
-            params = model.get_params()
-
-            for i in list(params):
-                v = params.get(i)
-                if len(str(v)) > 250:
-                    params.pop(i)
+            params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
 
             mlflow.log_params(params)
 
@@ -4910,7 +4809,6 @@ def tune_model(estimator,
             os.remove('Iterations.html')
     
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -4931,8 +4829,8 @@ def tune_model(estimator,
             input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
 
@@ -5041,6 +4939,8 @@ def ensemble_model(estimator,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -5178,7 +5078,7 @@ def ensemble_model(estimator,
     logger.info("Checking base model")
 
     def get_model_name(e):
-        return str(e).split("(")[0]
+        return type(e).__name__
 
     mn = get_model_name(estimator)
 
@@ -5467,7 +5367,7 @@ def ensemble_model(estimator,
     model_results = model_results.round(round)  
     
     # yellow the mean
-    model_results=model_results.style.apply(lambda x: ['background: yellow ' if (x.name == 'Mean') else '' for i in x], axis=1)
+    model_results=model_results.style.apply(lambda x: ['background: yellow'] * len(x), axis=1, subset=pd.IndexSlice[['Mean'], :])
     model_results = model_results.set_precision(round)
     
     progress.value += 1
@@ -5564,12 +5464,7 @@ def ensemble_model(estimator,
             # Get active run to log as tag
             RunID = mlflow.active_run().info.run_id
 
-            params = model.get_params()
-
-            for i in list(params):
-                v = params.get(i)
-                if len(str(v)) > 250:
-                    params.pop(i)
+            params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
 
             mlflow.log_params(params)
             mlflow.log_metrics({"MAE": avgs_mae[0], "MSE": avgs_mse[0], "RMSE": avgs_rmse[0], "R2" : avgs_r2[0],
@@ -5631,7 +5526,6 @@ def ensemble_model(estimator,
             os.remove('Results.html')
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -5652,8 +5546,8 @@ def ensemble_model(estimator,
             input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
             
@@ -5763,6 +5657,8 @@ def blend_models(estimator_list = 'All',
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -6269,7 +6165,7 @@ def blend_models(estimator_list = 'All',
     model_results = model_results.round(round)
     
     # yellow the mean
-    model_results=model_results.style.apply(lambda x: ['background: yellow' if (x.name == 'Mean') else '' for i in x], axis=1)
+    model_results=model_results.style.apply(lambda x: ['background: yellow'] * len(x), axis=1, subset=pd.IndexSlice[['Mean'], :])
     model_results = model_results.set_precision(round)
     progress.value += 1
     
@@ -6426,7 +6322,6 @@ def blend_models(estimator_list = 'All',
             os.remove('Results.html')
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -6447,8 +6342,8 @@ def blend_models(estimator_list = 'All',
             input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
 
@@ -6558,6 +6453,8 @@ def stack_models(estimator_list,
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -6730,40 +6627,12 @@ def stack_models(estimator_list,
         mask = actual != 0
         return (np.fabs(actual - prediction)/actual)[mask].mean()
 
-    logger.info("Getting model names")
-    #defining model_library model names
-    model_names = np.zeros(0)
-    for item in estimator_list:
-        model_names = np.append(model_names, str(item).split("(")[0])
-    
-    model_names_fixed = []
-    
-    for i in model_names:
-        if 'CatBoostRegressor' in i:
-            a = 'CatBoostRegressor'
-            model_names_fixed.append(a)
-        else:
-            model_names_fixed.append(i)
-            
-    model_names = model_names_fixed
-    
-    model_names_fixed = []
-    
-    counter = 0
-    for i in model_names:
-        s = str(i) + '_' + str(counter)
-        model_names_fixed.append(s)
-        counter += 1
-    
     logger.info("Compiling estimator_list parameter")
 
-    counter = 0
-    
+    #name each estimator by class with a positional suffix to keep names unique
     estimator_list_tuples = []
-    
-    for i in estimator_list:
-        estimator_list_tuples.append(tuple([model_names_fixed[counter], estimator_list[counter]]))
-        counter += 1
+    for counter, item in enumerate(estimator_list):
+        estimator_list_tuples.append((type(item).__name__ + '_' + str(counter), item))
 
     logger.info("Creating StackingRegressor()")
 
@@ -6931,7 +6800,7 @@ def stack_models(estimator_list,
     model_results = model_results.round(round)
     
     #Yellow the mean
-    model_results=model_results.style.apply(lambda x: ['background: yellow' if (x.name == 'Mean') else '' for i in x], axis=1)
+    model_results=model_results.style.apply(lambda x: ['background: yellow'] * len(x), axis=1, subset=pd.IndexSlice[['Mean'], :])
     model_results = model_results.set_precision(round)
 
     #refitting the model on complete X_train, y_train
@@ -7036,12 +6905,7 @@ def stack_models(estimator_list,
             # Get active run to log as tag
             RunID = mlflow.active_run().info.run_id
 
-            params = model.get_params()
-
-            for i in list(params):
-                v = params.get(i)
-                if len(str(v)) > 250:
-                    params.pop(i)
+            params = {k: v for k, v in model.get_params().items() if len(str(v)) <= 250}
             
             try:
                 mlflow.log_params(params)
@@ -7107,7 +6971,6 @@ def stack_models(estimator_list,
                 logger.info("SubProcess plot_model() end ==================================")
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -7128,8 +6991,8 @@ def stack_models(estimator_list,
             input_example = data_before_preprocess.drop([target_param], axis=1).iloc[0].to_dict()
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature, input_example = input_example)
             del(prep_pipe_temp)
 
@@ -7227,6 +7090,8 @@ def plot_model(estimator,
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -7714,6 +7579,8 @@ def interpret_model(estimator,
     import sys
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -8101,6 +7968,8 @@ def finalize_model(estimator):
     
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -8146,7 +8015,7 @@ def finalize_model(estimator):
 
     #determine runname for logging
     def get_model_name(e):
-        return str(e).split("(")[0]
+        return type(e).__name__
     
     model_dict_logging = {'ExtraTreesRegressor' : 'Extra Trees Regressor',
                         'GradientBoostingRegressor' : 'Gradient Boosting Regressor', 
@@ -8187,9 +8056,6 @@ def finalize_model(estimator):
     if 'BaggingRegressor' in mn:
         mn = get_model_name(estimator.base_estimator_)
 
-    if 'catboost' in mn:
-        mn = 'CatBoostRegressor'
-
     full_name = model_dict_logging.get(mn)
 
     logger.info("Finalizing " + str(full_name))
@@ -8221,8 +8087,8 @@ def finalize_model(estimator):
             RunID = mlflow.active_run().info.run_id
 
             # Log metrics
-            mlflow.log_metrics({"MAE": results.iloc[-2]['MAE'], "MSE": results.iloc[-2]['MSE'], "RMSE": results.iloc[-2]['RMSE'], "R2" : results.iloc[-2]['R2'],
-                                "RMSLE": results.iloc[-2]['RMSLE'], "MAPE": results.iloc[-2]['MAPE']})
+            mlflow.log_metrics({"MAE": results.at['Mean', 'MAE'], "MSE": results.at['Mean', 'MSE'], "RMSE": results.at['Mean', 'RMSE'], "R2" : results.at['Mean', 'R2'],
+                                "RMSLE": results.at['Mean', 'RMSLE'], "MAPE": results.at['Mean', 'MAPE']})
 
             #set tag of compare_models
             mlflow.set_tag("Source", "finalize_model")
@@ -8269,7 +8135,6 @@ def finalize_model(estimator):
                 logger.info("SubProcess plot_model() end ==================================")
 
             # Log model and transformation pipeline
-            from copy import deepcopy
 
             # get default conda env
             from mlflow.sklearn import get_default_conda_env
@@ -8289,8 +8154,8 @@ def finalize_model(estimator):
                 signature = None
 
             # log model as sklearn flavor
-            prep_pipe_temp = deepcopy(prep_pipe)
-            prep_pipe_temp.steps.append(['trained model', model_final])
+            from sklearn.pipeline import Pipeline
+            prep_pipe_temp = Pipeline(prep_pipe.steps + [['trained model', model_final]])
             mlflow.sklearn.log_model(prep_pipe_temp, "model", conda_env = default_conda_env, signature = signature)
             del(prep_pipe_temp)
 
@@ -8404,6 +8269,8 @@ def deploy_model(model,
     import sys
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -8587,6 +8454,8 @@ def save_model(model, model_name, model_only=False, verbose=True):
     import logging
     from copy import deepcopy
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -8621,12 +8490,12 @@ def save_model(model, model_name, model_only=False, verbose=True):
         model_ = deepcopy(model)
         logger.warning("Only Model saved. Transformations in prep_pipe are ignored.")
     else:
-        model_ = deepcopy(prep_pipe)
-        model_.steps.append(['trained model',model])
+        from sklearn.pipeline import Pipeline
+        model_ = Pipeline(prep_pipe.steps + [['trained model', model]])
     
     import joblib
     model_name = model_name + '.pkl'
-    joblib.dump(model_, model_name)
+    joblib.dump(model_, model_name, compress=3)
     if verbose:
         print('Transformation Pipeline and Model Succesfully Saved')
 
@@ -8766,6 +8635,8 @@ def automl(optimize='R2', use_holdout=False):
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -9007,6 +8878,15 @@ def get_logs(experiment_name = None, save = False):
 
     return runs
 
+#global variables accessible through get_config() and set_config()
+_config_variables = frozenset(['X', 'y', 'X_train', 'X_test', 'y_train', 'y_test',
+                               'seed', 'prep_pipe', 'target_inverse_transformer',
+                               'folds_shuffle_param', 'n_jobs_param', 'html_param',
+                               'create_model_container', 'master_model_container',
+                               'display_container', 'exp_name_log', 'logging_param',
+                               'log_plots_param', 'USI', 'data_before_preprocess',
+                               'target_param', 'gpu_param'])
+
 def get_config(variable):
 
     """
@@ -9049,6 +8929,8 @@ def get_config(variable):
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -9072,76 +8954,12 @@ def get_config(variable):
         logger.addHandler(ch)
 
     logger.info("Initializing get_config()")
-    logger.info("""get_config(variable={})""".\
-        format(str(variable)))
-
-    if variable == 'X':
-        global_var = X
-    
-    if variable == 'y':
-        global_var = y
-
-    if variable == 'X_train':
-        global_var = X_train
-
-    if variable == 'X_test':
-        global_var = X_test
-
-    if variable == 'y_train':
-        global_var = y_train
-
-    if variable == 'y_test':
-        global_var = y_test
-
-    if variable == 'seed':
-        global_var = seed
-
-    if variable == 'prep_pipe':
-        global_var = prep_pipe
-
-    if variable == 'target_inverse_transformer':
-        global_var = target_inverse_transformer
-
-    if variable == 'folds_shuffle_param':
-        global_var = folds_shuffle_param
-        
-    if variable == 'n_jobs_param':
-        global_var = n_jobs_param
-
-    if variable == 'html_param':
-        global_var = html_param
-
-    if variable == 'create_model_container':
-        global_var = create_model_container
-
-    if variable == 'master_model_container':
-        global_var = master_model_container
-
-    if variable == 'display_container':
-        global_var = display_container
-
-    if variable == 'exp_name_log':
-        global_var = exp_name_log
+    logger.info("get_config(variable=%s)", variable)
 
-    if variable == 'logging_param':
-        global_var = logging_param
+    if variable in _config_variables:
+        global_var = globals()[variable]
 
-    if variable == 'log_plots_param':
-        global_var = log_plots_param
-
-    if variable == 'USI':
-        global_var = USI
-
-    if variable == 'data_before_preprocess':
-        global_var = data_before_preprocess
-
-    if variable == 'target_param':
-        global_var = target_param
-
-    if variable == 'gpu_param':
-        global_var = gpu_param
-
-    logger.info("Global variable: " + str(variable) + ' returned')
+    logger.info("Global variable: %s returned", variable)
     logger.info("get_config() succesfully completed......................................")
 
     return global_var
@@ -9186,6 +9004,8 @@ def set_config(variable,value):
 
     import logging
 
+    global logger
+
     try:
         hasattr(logger, 'name')
     except:
@@ -9209,98 +9029,12 @@ def set_config(variable,value):
         logger.addHandler(ch)
 
     logger.info("Initializing set_config()")
-    logger.info("""set_config(variable={}, value={})""".\
-        format(str(variable), str(value)))
-
-    if variable == 'X':
-        global X
-        X = value
-
-    if variable == 'y':
-        global y
-        y = value
-
-    if variable == 'X_train':
-        global X_train
-        X_train = value
-
-    if variable == 'X_test':
-        global X_test
-        X_test = value
-
-    if variable == 'y_train':
-        global y_train
-        y_train = value
-
-    if variable == 'y_test':
-        global y_test
-        y_test = value
-
-    if variable == 'seed':
-        global seed
-        seed = value
-
-    if variable == 'prep_pipe':
-        global prep_pipe
-        prep_pipe = value
-
-    if variable == 'target_inverse_transformer':
-        global target_inverse_transformer
-        target_inverse_transformer = value
-
-    if variable == 'folds_shuffle_param':
-        global folds_shuffle_param
-        folds_shuffle_param = value
-
-    if variable == 'n_jobs_param':
-        global n_jobs_param
-        n_jobs_param = value
-
-    if variable == 'html_param':
-        global html_param
-        html_param = value
-
-    if variable == 'create_model_container':
-        global create_model_container
-        create_model_container = value
-
-    if variable == 'master_model_container':
-        global master_model_container
-        master_model_container = value
-
-    if variable == 'display_container':
-        global display_container
-        display_container = value
-
-    if variable == 'exp_name_log':
-        global exp_name_log
-        exp_name_log = value
-
-    if variable == 'logging_param':
-        global logging_param
-        logging_param = value
-
-    if variable == 'log_plots_param':
-        global log_plots_param
-        log_plots_param = value
-
-    if variable == 'USI':
-        global USI
-        USI = value
-
-    if variable == 'data_before_preprocess':
-        global data_before_preprocess
-        data_before_preprocess = value
-
-    if variable == 'target_param':
-        global target_param
-        target_param = value
+    logger.info("set_config(variable=%s, value=%s)", variable, value)
 
-    if variable == 'gpu_param':
-        global gpu_param
-        gpu_param = value
+    if variable in _config_variables:
+        globals()[variable] = value
 
-    logger.info("Global variable:  " + str(variable) + ' updated')
+    logger.info("Global variable: %s updated", variable)
     logger.info("set_config() succesfully completed......................................")
 
 def get_system_logs():
@@ -116,5 +116,9 @@ def test():
 
     assert 1 == 1
 
+def test_check_metric_unknown_metric():
+    with pytest.raises(ValueError):
+        pycaret.utils.check_metric([0, 1], [0, 1], "Unknown")
+
 if __name__ == "__main__":
     test()
@@ -14,84 +14,87 @@ def nightly_version():
 def __version__():
     return version_
 
-def check_metric(actual, prediction, metric, round=4):
-    
-    """
-    Function to evaluate classification and regression metrics.
-    """
-    
-    #general dependencies
-    import numpy as np
+def _accuracy(actual, prediction):
     from sklearn import metrics
+    return metrics.accuracy_score(actual,prediction)
 
-    #metric calculation starts here
-    
-    if metric == 'Accuracy':
-        
-        result = metrics.accuracy_score(actual,prediction)
-        result = result.round(round)
-        
-    elif metric == 'Recall':
-        
-        result = metrics.recall_score(actual,prediction)
-        result = result.round(round)
-        
-    elif metric == 'Precision':
-        
-        result = metrics.precision_score(actual,prediction)
-        result = result.round(round)
-        
-    elif metric == 'F1':
-        
-        result = metrics.f1_score(actual,prediction)
-        result = result.round(round)
-        
-    elif metric == 'Kappa':
-        
-        result = metrics.cohen_kappa_score(actual,prediction)
-        result = result.round(round)
-       
-    elif metric == 'AUC':
-        
-        result = metrics.roc_auc_score(actual,prediction)
-        result = result.round(round)
-        
-    elif metric == 'MCC':
-        
-        result = metrics.matthews_corrcoef(actual,prediction)
-        result = result.round(round)
+def _recall(actual, prediction):
+    from sklearn import metrics
+    return metrics.recall_score(actual,prediction)
 
-    elif metric == 'MAE':
+def _precision(actual, prediction):
+    from sklearn import metrics
+    return metrics.precision_score(actual,prediction)
 
-        result = metrics.mean_absolute_error(actual,prediction)
-        result = result.round(round)
-        
-    elif metric == 'MSE':
+def _f1(actual, prediction):
+    from sklearn import metrics
+    return metrics.f1_score(actual,prediction)
 
-        result = metrics.mean_squared_error(actual,prediction)
-        result = result.round(round)        
-        
-    elif metric == 'RMSE':
+def _kappa(actual, prediction):
+    from sklearn import metrics
+    return metrics.cohen_kappa_score(actual,prediction)
 
-        result = metrics.mean_squared_error(actual,prediction)
-        result = np.sqrt(result)
-        result = result.round(round)     
-        
-    elif metric == 'R2':
+def _auc(actual, prediction):
+    from sklearn import metrics
+    return metrics.roc_auc_score(actual,prediction)
 
-        result = metrics.r2_score(actual,prediction)
-        result = result.round(round)    
-        
-    elif metric == 'RMSLE':
+def _mcc(actual, prediction):
+    from sklearn import metrics
+    return metrics.matthews_corrcoef(actual,prediction)
 
-        result = np.sqrt(np.mean(np.power(np.log(np.array(abs(prediction))+1) - np.log(np.array(abs(actual))+1), 2)))
-        result = result.round(round)
+def _mae(actual, prediction):
+    from sklearn import metrics
+    return metrics.mean_absolute_error(actual,prediction)
 
-    elif metric == 'MAPE':
+def _mse(actual, prediction):
+    from sklearn import metrics
+    return metrics.mean_squared_error(actual,prediction)
+
+def _rmse(actual, prediction):
+    import numpy as np
+    from sklearn import metrics
+    return np.sqrt(metrics.mean_squared_error(actual,prediction))
+
+def _r2(actual, prediction):
+    from sklearn import metrics
+    return metrics.r2_score(actual,prediction)
 
-        mask = actual.iloc[:,0] != 0
-        result = (np.fabs(actual.iloc[:,0] - prediction.iloc[:,0])/actual.iloc[:,0])[mask].mean()
-        result = result.round(round)
+def _rmsle(actual, prediction):
+    import numpy as np
+    return np.sqrt(np.mean(np.power(np.log(np.array(abs(prediction))+1) - np.log(np.array(abs(actual))+1), 2)))
+
+def _mape(actual, prediction):
+    import numpy as np
+    mask = actual.iloc[:,0] != 0
+    return (np.fabs(actual.iloc[:,0] - prediction.iloc[:,0])/actual.iloc[:,0])[mask].mean()
+
+#metric name to scoring function
+_metric_dict = {'Accuracy' : _accuracy,
+                'Recall' : _recall,
+                'Precision' : _precision,
+                'F1' : _f1,
+                'Kappa' : _kappa,
+                'AUC' : _auc,
+                'MCC' : _mcc,
+                'MAE' : _mae,
+                'MSE' : _mse,
+                'RMSE' : _rmse,
+                'R2' : _r2,
+                'RMSLE' : _rmsle,
+                'MAPE' : _mape}
+
+def check_metric(actual, prediction, metric, round=4):
+    
+    """
+    Function to evaluate classification and regression metrics.
+    """
+    
+    if metric not in _metric_dict:
+        raise ValueError("metric must be one of " + ", ".join(_metric_dict) + ", got '" + str(metric) + "'.")
+
+    #metric calculation starts here
+    result = _metric_dict[metric](actual,prediction)
+    result = result.round(round)
        
     return float(result)
 